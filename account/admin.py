@@ -12,9 +12,129 @@ built-in `UserAdmin` to fit the custom Account model defined in
 `account/models.py`.
 
 """
+from datetime import timedelta
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from account.models import Account
+from django.contrib.auth.models import Permission
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Sum
+from django.utils import timezone
+from django.utils.functional import cached_property
+from account.models import Account, AccountRoleCounts
+
+
+class FasterAdminPaginator(Paginator):
+    """
+    Paginator that avoids `SELECT COUNT(*)` on unfiltered changelists.
+
+    When no filter or search is applied, the row count is taken from
+    PostgreSQL's planner estimate in `pg_class`. Filtered querysets, and
+    tables small enough for an exact count to be cheap, fall back to
+    the regular count.
+    """
+    #: Below this estimate an exact count is used instead
+    estimate_threshold = 10000
+
+    @cached_property
+    def count(self):
+        query = getattr(self.object_list, 'query', None)
+        if query is not None and not query.where:
+            with connections[self.object_list.db].cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [self.object_list.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= self.estimate_threshold:
+                return row[0]
+        return super().count
+
+
+class DateJoinedRangeFilter(admin.SimpleListFilter):
+    """
+    Filter accounts by fixed `date_joined` ranges.
+
+    Each option becomes a single `date_joined__gte` lookup that can use
+    the index on `date_joined`.
+    """
+    title = 'date joined'
+    parameter_name = 'joined'
+
+    def lookups(self, request, model_admin):
+        return (
+            ('7d', 'Last 7 days'),
+            ('30d', 'Last 30 days'),
+            ('year', 'This year'),
+        )
+
+    def queryset(self, request, queryset):
+        now = timezone.now()
+        if self.value() == '7d':
+            since = now - timedelta(days=7)
+        elif self.value() == '30d':
+            since = now - timedelta(days=30)
+        elif self.value() == 'year':
+            since = timezone.localtime(now).replace(
+                month=1, day=1, hour=0, minute=0, second=0, microsecond=0
+            )
+        else:
+            return queryset
+        return queryset.filter(date_joined__gte=since)
+
+
+class RoleCountListFilter(admin.SimpleListFilter):
+    """
+    Filter accounts by role, labelled with the number of accounts.
+
+    Counts are read from `AccountRoleCounts` (a materialized view)
+    rather than aggregated from the accounts table on each request.
+    """
+    title = 'role'
+    parameter_name = 'role'
+
+    def lookups(self, request, model_admin):
+        totals = dict(
+            AccountRoleCounts.objects.values_list('role')
+            .annotate(Sum('total'))
+            .order_by()
+        )
+        return tuple(
+            (role, f"{label} ({totals.get(role, 0)})")
+            for role, label in Account.ROLE_CHOICES
+        )
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(role=self.value())
+        return queryset
+
+
+@admin.register(Permission)
+class PermissionAdmin(admin.ModelAdmin):
+    """
+    Read-only admin for Permission, required by the `user_permissions`
+    autocomplete on `AccountAdmin`.
+    """
+    list_display = ('name', 'codename', 'content_type')
+    search_fields = ('name', 'codename')
+
+    # Permissions are managed by migrations; the admin only reads them.
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+    def get_queryset(self, request):
+        """
+        Fetch content types with permissions, as `Permission.__str__`
+        (used for autocomplete results) reads them.
+        """
+        return super().get_queryset(request).select_related('content_type')
 
 
 @admin.register(Account)
@@ -29,21 +149,34 @@ class AccountAdmin(UserAdmin):
       - Support an improved UI for managing ManyToMany permission fields.
     """
     ordering = ('-date_updated',)
+    #: Columns shown to every admin; see `get_list_display`
     list_display = [
-        'first_name', 'last_name', 'email', 'sex',
-        'phone_number', 'role', 'is_active', 'is_verified',
-        'date_joined', 'date_updated'
+        'first_name', 'last_name', 'email', 'role', 'is_active',
+        'is_verified', 'date_updated'
     ]
+    #: Email is matched by prefix; both lookups are served by the
+    #: trigram indexes on `Account`.
     search_fields = (
-        'email', 'first_name'
+        '^email', 'full_name_stored'
     )
+    search_help_text = "Email prefix or name"
     list_filter = (
         'is_active',
         'is_verified',
         'is_staff',
-        'role',
-        'date_joined',
+        RoleCountListFilter,
+        DateJoinedRangeFilter,
     )
+    #: Role totals come from `RoleCountListFilter`; never run live facet
+    #: counts over the accounts table.
+    show_facets = admin.ShowFacets.NEVER
+    #: Estimate the changelist total instead of counting every row
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
+
+    #: No foreign keys are shown yet; extend this when some are added
+    list_select_related = ()
+
     #: Fields that cannot be edited directly in the admin
     readonly_fields = ('date_joined', 'date_updated', 'last_login',)
 
@@ -70,8 +203,8 @@ class AccountAdmin(UserAdmin):
         }),
     )
 
-    # Better interface for Many-to-Many fields
-    filter_horizontal = (
+    # Load Many-to-Many choices on demand instead of rendering them all
+    autocomplete_fields = (
         'groups',
         'user_permissions',
     )
@@ -95,3 +228,23 @@ class AccountAdmin(UserAdmin):
             )
         }),
     )
+
+    def get_list_display(self, request):
+        """
+        Add the staff column for superusers only.
+
+        This only trims the changelist for other admins; it doesn't
+        restrict who can edit `is_staff` through the change form.
+        """
+        list_display = list(self.list_display)
+        if request.user.is_superuser:
+            list_display.append('is_staff')
+        return list_display
+
+    def get_list_filter(self, request):
+        """
+        Offer the staff filter to superusers only, like the staff column.
+        """
+        if request.user.is_superuser:
+            return self.list_filter
+        return tuple(f for f in self.list_filter if f != 'is_staff')
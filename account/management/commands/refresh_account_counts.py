@@ -0,0 +1,19 @@
+"""
+=====================================================
+account/management/commands/refresh_account_counts.py
+=====================================================
+
+Refreshes the `account_role_counts` materialized view behind
+`AccountRoleCounts`. Schedule it (e.g. with cron) every few minutes to
+keep the admin's per-role totals current.
+"""
+from django.core.management.base import BaseCommand
+from account.models import AccountRoleCounts
+
+
+class Command(BaseCommand):
+    help = "Refresh the account counts shown in the admin."
+
+    def handle(self, *args, **options):
+        AccountRoleCounts.refresh()
+        self.stdout.write(self.style.SUCCESS("Account counts refreshed."))
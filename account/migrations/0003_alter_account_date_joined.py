@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0002_remove_account_age_account_dob'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='account',
+            name='date_joined',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0005_account_acct_email_trgm_idx'),
+    ]
+
+    # The view depends on account_account.role, is_active and is_verified.
+    # PostgreSQL won't alter the type of a column used by a view, so any
+    # later migration altering those columns must drop this view before
+    # the change and recreate it (with the unique index) afterwards.
+    operations = [
+        migrations.RunSQL(
+            sql=[
+                """
+                CREATE MATERIALIZED VIEW account_role_counts AS
+                SELECT
+                    row_number() OVER (
+                        ORDER BY role, is_active, is_verified
+                    ) AS id,
+                    role,
+                    is_active,
+                    is_verified,
+                    count(*) AS total
+                FROM account_account
+                GROUP BY role, is_active, is_verified
+                """,
+                # Required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+                """
+                CREATE UNIQUE INDEX account_role_counts_key
+                ON account_role_counts (role, is_active, is_verified)
+                """,
+            ],
+            reverse_sql="DROP MATERIALIZED VIEW account_role_counts",
+        ),
+        migrations.CreateModel(
+            name='AccountRoleCounts',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('role', models.CharField(choices=[('tenant', 'Tenant'), ('landlord', 'Landlord'), ('agent', 'Agent'), ('admin', 'Admin')], max_length=8)),
+                ('is_active', models.BooleanField()),
+                ('is_verified', models.BooleanField()),
+                ('total', models.BigIntegerField()),
+            ],
+            options={
+                'db_table': 'account_role_counts',
+                'managed': False,
+            },
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-15 09:23
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('account', '0006_accountrolecounts'),
+        ('auth', '0012_alter_user_first_name_max_length'),
+    ]
+
+    operations = [
+        # Adding a stored generated column rewrites account_account under
+        # an ACCESS EXCLUSIVE lock; run this in a maintenance window.
+        migrations.AddField(
+            model_name='account',
+            name='full_name_stored',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.text.Concat('first_name', models.Value(' '), 'last_name'), output_field=models.CharField(max_length=101)),
+        ),
+        migrations.AddIndex(
+            model_name='account',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('full_name_stored'), name='gin_trgm_ops'), name='acct_full_name_trgm_idx'),
+        ),
+    ]
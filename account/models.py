@@ -11,13 +11,15 @@ identifier instead of a username. It also supports role-based access
 (e.g., tenant, landlord, agent, admin) and includes helper methods
 for user management and authentication.
 """
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import connection, models
+from django.db.models import F, Func, Q, Value
+from django.db.models.functions import Cast, Concat, Upper
 from django.contrib.auth.models import (
     AbstractBaseUser, PermissionsMixin, BaseUserManager
 )
 import uuid
-from django.core.exceptions import ObjectDoesNotExist
-from datetime import datetime
+from django.utils import timezone
 
 # -------------------
 # Account Manager
@@ -43,12 +45,40 @@ class AccountManager(BaseUserManager):
         Notes:
             This method avoids raising exceptions like
             ObjectDoesNotExist or ValueError, returning None instead.
+            Malformed IDs are rejected before querying, and missing
+            accounts are handled with `.first()` rather than a
+            DoesNotExist exception.
         """
-        try:
-            instance = self.get(id=id)
-            return instance
-        except (ObjectDoesNotExist, ValueError, TypeError):
-            return None
+        if not isinstance(id, uuid.UUID):
+            try:
+                id = uuid.UUID(str(id))
+            except (ValueError, TypeError, AttributeError):
+                return None
+        return self.filter(pk=id).first()
+
+    def with_age(self):
+        """
+        Return a queryset annotated with each account's age.
+
+        The age is computed by PostgreSQL as `age_years` in the same
+        query, so list views don't need to call the `age` property on
+        every row.
+
+        Returns:
+            QuerySet: Accounts annotated with `age_years` (None when
+            `dob` is not set).
+        """
+        # Django's Extract() refuses 'year' on intervals, so EXTRACT is
+        # spelled out; the column reference is still resolved by the ORM.
+        age = Func(F('dob'), function='AGE', output_field=models.DurationField())
+        years = Func(
+            age,
+            template='EXTRACT(YEAR FROM %(expressions)s)',
+            output_field=models.IntegerField()
+        )
+        return self.get_queryset().annotate(
+            age_years=Cast(years, models.IntegerField())
+        )
 
     def create_user(self, email, password=None, **extra_fields):
         """
@@ -82,14 +112,16 @@ class AccountManager(BaseUserManager):
         Override this method to normalize email input
         before attempting to find the user in the database.
 
+        Only the domain is lowercased, matching `create_user`, so the
+        lookup stays an exact match on the unique `email` index.
+
         Args:
             email (str): Email address to look up.
 
         Returns:
             Account: Matching user instance if found.
         """
-        email = self.normalize_email(email)
-        return super().get_by_natural_key(email)
+        return self.get(email=self.normalize_email(email))
     
     def create_superuser(self, email, password=None, **extra_fields):
         """
@@ -137,6 +169,8 @@ class Account(AbstractBaseUser, PermissionsMixin):
         id (UUID): Primary key, auto-generated UUID.
         first_name (str): User’s first name.
         last_name (str): User’s last name.
+        full_name_stored (str): "First Last", generated by the database
+            for queries; use `full_name` on instances.
         email (str): Unique email used as the login credential.
         phone_number (str): Unique contact number.
         sex (str): Gender, one of 'male', 'female', or 'other'.
@@ -162,6 +196,10 @@ class Account(AbstractBaseUser, PermissionsMixin):
         ("female", "Female"),
         ("other", "Other"),
     )
+
+    # Precomputed for constant-time choice validation
+    ROLE_SET = frozenset(choice[0] for choice in ROLE_CHOICES)
+    SEX_SET = frozenset(choice[0] for choice in SEX_CHOICES)
     id = models.UUIDField(
         default=uuid.uuid4,
         editable=False,
@@ -170,6 +208,13 @@ class Account(AbstractBaseUser, PermissionsMixin):
     )
     first_name = models.CharField(max_length=50, null=False, blank=False)
     last_name = models.CharField(null=False, blank=False, max_length=50)
+    # Stored by PostgreSQL so it can be selected and searched as a column.
+    # Only current once loaded from the database; instances use `full_name`.
+    full_name_stored = models.GeneratedField(
+        expression=Concat('first_name', Value(' '), 'last_name'),
+        output_field=models.CharField(max_length=101),
+        db_persist=True
+    )
     email = models.EmailField(unique=True, db_index=True)
     phone_number = models.CharField(max_length=20, unique=True)
     sex = models.CharField(choices=SEX_CHOICES, max_length=10)
@@ -191,7 +236,7 @@ class Account(AbstractBaseUser, PermissionsMixin):
     is_active = models.BooleanField(default=True)
     is_verified = models.BooleanField(default=False)
     is_staff = models.BooleanField(default=False)
-    date_joined = models.DateTimeField(auto_now_add=True)
+    date_joined = models.DateTimeField(auto_now_add=True, db_index=True)
     date_updated = models.DateTimeField(auto_now=True)
 
     objects = AccountManager()
@@ -202,6 +247,32 @@ class Account(AbstractBaseUser, PermissionsMixin):
     REQUIRED_FIELDS = [
         'first_name',
     ]
+
+    class Meta:
+        indexes = [
+            # Default ordering of the users list and admin changelist
+            models.Index(
+                fields=['-date_updated'], name='acct_updated_desc_idx'
+            ),
+            models.Index(
+                fields=['role', 'is_active'], name='acct_role_active_idx'
+            ),
+            models.Index(
+                fields=['is_verified', 'is_active'],
+                condition=Q(is_active=True),
+                name='acct_verified_active_idx'
+            ),
+            # Django's case-insensitive pattern lookups compare UPPER()
+            # of the column, so the trigram indexes cover that expression.
+            GinIndex(
+                OpClass(Upper('full_name_stored'), name='gin_trgm_ops'),
+                name='acct_full_name_trgm_idx'
+            ),
+            GinIndex(
+                OpClass(Upper('email'), name='gin_trgm_ops'),
+                name='acct_email_trgm_idx'
+            ),
+        ]
     
     @property
     def full_name(self):
@@ -211,19 +282,32 @@ class Account(AbstractBaseUser, PermissionsMixin):
         Returns:
             str: The user’s full name in "First Last" format.
         """
-        return f"{self.first_name} {self.last_name}"
-    
+        return ' '.join((self.first_name, self.last_name))
+
+    @staticmethod
+    def _compute_age(dob, today):
+        """Returns the age for `dob` as of `today`.
+
+        Lets callers serializing many accounts share a single `today`.
+
+        Args:
+            dob (date): Date of birth, or None.
+            today (date): The reference date.
+
+        Returns:
+            int: The age in years, or None if `dob` is not set.
+        """
+        if dob is None:
+            return None
+        return (today.year - dob.year) - ((today.month, today.day) < (dob.month, dob.day))
+
     @property
     def age(self):
         """Returns user's age.
         Returns:
             int: The user's age.
         """
-        if self.dob is None:
-            return None
-        today = datetime.now()
-        age = (today.year - self.dob.year) - ((today.month, today.day) < (self.dob.month, self.dob.day))
-        return age
+        return self._compute_age(self.dob, timezone.localdate())
   
     def __str__(self):
         """
@@ -233,5 +317,49 @@ class Account(AbstractBaseUser, PermissionsMixin):
             str: User’s email and role (e.g., "user@example.com (tenant)").
         """
         return f"{self.email} ({self.role})\nID: {self.id}"
-    
-    
+
+
+# ---------------------------
+# ACCOUNT ROLE COUNTS
+# ---------------------------
+class AccountRoleCounts(models.Model):
+    """
+    Number of accounts per role, active and verified status.
+
+    Read-only model over the `account_role_counts` materialized view, so
+    admin dashboards can show totals without aggregating the accounts
+    table on every page load. The view is refreshed with `refresh()`
+    (see the `refresh_account_counts` management command), so counts
+    may lag behind live data.
+
+    The view reads `role`, `is_active` and `is_verified` from
+    `account_account`, and PostgreSQL refuses to alter the type of a
+    column used by a view. A migration changing those columns must drop
+    the view first and recreate it (with its unique index) afterwards,
+    using the SQL in migration 0006.
+
+    Attributes:
+        role (str): Account role.
+        is_active (bool): Whether the counted accounts are active.
+        is_verified (bool): Whether the counted accounts are verified.
+        total (int): Number of accounts in this group.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    role = models.CharField(choices=Account.ROLE_CHOICES, max_length=8)
+    is_active = models.BooleanField()
+    is_verified = models.BooleanField()
+    total = models.BigIntegerField()
+
+    class Meta:
+        managed = False
+        db_table = 'account_role_counts'
+
+    @classmethod
+    def refresh(cls):
+        """
+        Recompute the counts without blocking readers of the view.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'REFRESH MATERIALIZED VIEW CONCURRENTLY "{cls._meta.db_table}"'
+            )
@@ -3,14 +3,84 @@
 serializer.py
 ==========================================
 """
+from django.conf import settings
+from django.utils.encoding import filepath_to_uri
+from django.utils import timezone
 from rest_framework import serializers
 from account.models import Account
 from datetime import date
 
+#: Columns read by `account_profile_representation`, in output order.
+#: `age_years` comes from `Account.objects.with_age()`.
+PROFILE_READ_FIELDS = (
+    'id', 'full_name_stored', 'email', 'phone_number', 'sex', 'role', 'dob',
+    'age_years', 'address', 'profile_photo', 'date_updated', 'date_joined'
+)
+
+
+def profile_photo_url(name, request=None):
+    """
+    Return the public URL of a stored profile photo.
+
+    When `MEDIA_CDN_BASE` is set, the URL is built by joining it with
+    the file name, avoiding a storage backend call per photo. Otherwise
+    the storage URL is used, made absolute when a request is given.
+
+    Args:
+        name (str): Stored file name of the photo.
+        request (Request): Used to build absolute URLs.
+
+    Returns:
+        str or None: The photo URL, or None if there is no photo.
+    """
+    if not name:
+        return None
+    if settings.MEDIA_CDN_BASE:
+        return f"{settings.MEDIA_CDN_BASE.rstrip('/')}/{filepath_to_uri(name)}"
+    url = Account._meta.get_field('profile_photo').storage.url(name)
+    if request is not None:
+        url = request.build_absolute_uri(url)
+    return url
+
+
+def account_profile_representation(row, request=None):
+    """
+    Build the public profile of an account from a `.values()` row.
+
+    Renders to the same JSON as `AccountProfileReadSerializer` without
+    instantiating model objects or running DRF's per-field dispatch,
+    which keeps list endpoints cheap.
+
+    Args:
+        row (dict): Values for `PROFILE_READ_FIELDS`.
+        request (Request): Used to build absolute photo URLs.
+
+    Returns:
+        dict: The serialized account profile.
+    """
+    dob = row['dob']
+    return {
+        'id': row['id'],
+        'full_name': row['full_name_stored'],
+        'email': row['email'],
+        'phone_number': row['phone_number'],
+        'sex': row['sex'],
+        'role': row['role'],
+        'dob': dob.strftime('%d/%m/%Y') if dob else None,
+        'age': row['age_years'],
+        'address': row['address'],
+        'profile_photo': profile_photo_url(row['profile_photo'], request),
+        'date_updated': row['date_updated'],
+        'date_joined': row['date_joined'],
+    }
+
+
 class AccountProfileReadSerializer(serializers.ModelSerializer):
     date_joined = serializers.DateTimeField(read_only=True)
     date_updated = serializers.DateTimeField(read_only=True)
     dob = serializers.DateField(format='%d/%m/%Y', input_formats=['%d-%m-%Y', '%d/%m/%Y'])
+    age = serializers.SerializerMethodField()
+    profile_photo = serializers.SerializerMethodField()
     class Meta:
         model = Account
         fields = [
@@ -18,6 +88,16 @@ class AccountProfileReadSerializer(serializers.ModelSerializer):
             'age', 'address', 'profile_photo', 'date_updated', 'date_joined'
         ]
 
+    def get_age(self, obj):
+        # Pass `today` in the context to share it across many accounts.
+        today = self.context.get('today') or timezone.localdate()
+        return Account._compute_age(obj.dob, today)
+
+    def get_profile_photo(self, obj):
+        return profile_photo_url(
+            obj.profile_photo.name, self.context.get('request')
+        )
+
 class AccountProfileWriteSerializer(serializers.ModelSerializer):
     dob = serializers.DateField(input_formats=['%d-%m-%Y', '%d/%m/%Y'])
     class Meta:
@@ -35,6 +115,10 @@ class AccountProfileWriteSerializer(serializers.ModelSerializer):
             
 
 class AccountRegisterSerializer(serializers.ModelSerializer):
+    # Plain CharFields so `validate_role`/`validate_sex` are the only
+    # choice checks, using the precomputed sets on `Account`.
+    role = serializers.CharField(max_length=8, required=False)
+    sex = serializers.CharField(max_length=10)
     class Meta:
         model = Account
         fields = [
@@ -46,4 +130,18 @@ class AccountRegisterSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError(
                 "Date of birth can't be in the future"
             )
-        return dob
\ No newline at end of file
+        return dob
+
+    def validate_role(self, role):
+        if role not in Account.ROLE_SET:
+            raise serializers.ValidationError(
+                f"{role} is not a valid role"
+            )
+        return role
+
+    def validate_sex(self, sex):
+        if sex not in Account.SEX_SET:
+            raise serializers.ValidationError(
+                f"{sex} is not a valid sex"
+            )
+        return sex
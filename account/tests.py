@@ -1,3 +1,238 @@
+import json
+from datetime import date
+from django.contrib.auth import authenticate
+from django.contrib.auth.models import Permission
+from django.db.models import OuterRef, Subquery
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from account.models import Account
+from account.serializers import (
+    PROFILE_READ_FIELDS, AccountProfileReadSerializer,
+    AccountRegisterSerializer, account_profile_representation
+)
 
-# Create your tests here.
+
+class AccountLoginTests(TestCase):
+    """
+    Login looks accounts up by email, lowercasing only the domain.
+    """
+    password = 'S3cure-pass!'
+
+    def create_account(self, email, phone_number):
+        return Account.objects.create_user(
+            email, self.password, first_name='Test',
+            last_name='User', phone_number=phone_number
+        )
+
+    def test_login_ignores_domain_case(self):
+        account = self.create_account('Foo@Example.COM', '08000000001')
+
+        self.assertEqual(account.email, 'Foo@example.com')
+        self.assertEqual(
+            authenticate(email='Foo@EXAMPLE.com', password=self.password),
+            account
+        )
+
+    def test_login_matches_local_part_exactly(self):
+        self.create_account('Foo@example.com', '08000000001')
+
+        self.assertIsNone(
+            authenticate(email='foo@example.com', password=self.password)
+        )
+
+    def test_login_with_case_variant_accounts(self):
+        upper = self.create_account('Foo@example.com', '08000000001')
+        lower = self.create_account('foo@example.com', '08000000002')
+
+        self.assertEqual(
+            authenticate(email='Foo@Example.com', password=self.password),
+            upper
+        )
+        self.assertEqual(
+            authenticate(email='foo@EXAMPLE.com', password=self.password),
+            lower
+        )
+
+
+class AccountFullNameTests(TestCase):
+    """
+    `full_name` is computed in Python; `full_name_stored` mirrors it in
+    the database.
+    """
+    def test_full_name_on_unsaved_account(self):
+        account = Account(first_name='Ada', last_name='Obi')
+
+        with self.assertNumQueries(0):
+            self.assertEqual(account.full_name, 'Ada Obi')
+
+    def test_full_name_follows_name_changes(self):
+        account = Account.objects.create_user(
+            'ada@example.com', 'S3cure-pass!', first_name='Ada',
+            last_name='Obi', phone_number='08000000001'
+        )
+        account.first_name = 'Adaeze'
+        account.save()
+
+        self.assertEqual(account.full_name, 'Adaeze Obi')
+        account.refresh_from_db()
+        self.assertEqual(account.full_name_stored, 'Adaeze Obi')
+
+
+class AccountRegisterSerializerTests(TestCase):
+    """
+    Role and sex are validated against `Account.ROLE_SET`/`SEX_SET`.
+    """
+    data = {
+        'first_name': 'Ada', 'last_name': 'Obi', 'email': 'ada@example.com',
+        'phone_number': '08000000001', 'sex': 'female', 'role': 'landlord',
+    }
+
+    def test_valid_choices(self):
+        serializer = AccountRegisterSerializer(data=self.data)
+
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data['role'], 'landlord')
+
+    def test_role_is_optional(self):
+        data = {k: v for k, v in self.data.items() if k != 'role'}
+        serializer = AccountRegisterSerializer(data=data)
+
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertNotIn('role', serializer.validated_data)
+
+    def test_invalid_choices(self):
+        serializer = AccountRegisterSerializer(
+            data={**self.data, 'role': 'owner', 'sex': 'unknown'}
+        )
+
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(serializer.errors['role'], ['owner is not a valid role'])
+        self.assertEqual(serializer.errors['sex'], ['unknown is not a valid sex'])
+
+
+class AccountWithAgeTests(TestCase):
+    """
+    `Account.objects.with_age()` annotates the age computed by PostgreSQL.
+    """
+    def test_age_inside_subquery(self):
+        dob = date(1990, 6, 15)
+        account = Account.objects.create_user(
+            'ada@example.com', 'S3cure-pass!', first_name='Ada',
+            last_name='Obi', phone_number='08000000001', dob=dob
+        )
+        ages = Account.objects.with_age().filter(
+            pk=OuterRef('pk')
+        ).values('age_years')
+
+        self.assertEqual(
+            Account.objects.annotate(
+                age_years=Subquery(ages)
+            ).get(pk=account.pk).age_years,
+            Account._compute_age(dob, timezone.localdate())
+        )
+
+
+class AccountProfileReadTests(TestCase):
+    """
+    `get_users` builds profiles from `.values()` rows, which must render
+    like `AccountProfileReadSerializer`.
+    """
+    def create_account(self, email, phone_number, **extra_fields):
+        return Account.objects.create_user(
+            email, 'S3cure-pass!', first_name='Ada', last_name='Obi',
+            phone_number=phone_number, **extra_fields
+        )
+
+    def render(self, data):
+        return json.loads(JSONRenderer().render(data))
+
+    def test_representation_matches_serializer(self):
+        account = self.create_account(
+            'ada@example.com', '08000000001', dob=date(1990, 6, 15),
+            profile_photo='images/ada obi.png'
+        )
+        row = Account.objects.with_age().values(
+            *PROFILE_READ_FIELDS
+        ).get(pk=account.pk)
+        account.refresh_from_db()
+
+        self.assertEqual(
+            self.render(account_profile_representation(row)),
+            self.render(AccountProfileReadSerializer(account).data)
+        )
+
+    def test_get_users_is_paginated(self):
+        dob = date(1990, 6, 15)
+        account = self.create_account(
+            'ada@example.com', '08000000001', dob=dob,
+            profile_photo='images/ada obi.png'
+        )
+        self.create_account('bola@example.com', '08000000002')
+        self.create_account('chi@example.com', '08000000003')
+
+        response = self.client.get(reverse('get-users'), {'page_size': 2})
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(
+            set(body), {'count', 'next', 'previous', 'results'}
+        )
+        self.assertEqual(body['count'], 3)
+        self.assertIsNotNone(body['next'])
+        self.assertIsNone(body['previous'])
+        self.assertEqual(len(body['results']), 2)
+
+        last_page = self.client.get(body['next']).json()
+        profiles = body['results'] + last_page['results']
+        self.assertEqual(len({p['id'] for p in profiles}), 3)
+
+        profile = next(p for p in profiles if p['id'] == str(account.pk))
+        self.assertEqual(
+            profile['age'], Account._compute_age(dob, timezone.localdate())
+        )
+        self.assertEqual(profile['dob'], '15/06/1990')
+        self.assertEqual(profile['full_name'], 'Ada Obi')
+        self.assertEqual(
+            profile['profile_photo'],
+            'http://testserver/media/images/ada%20obi.png'
+        )
+
+
+class AccountAdminTests(TestCase):
+    """
+    The staff column and filter are only offered to superusers.
+    """
+    password = 'S3cure-pass!'
+
+    def get_changelist(self, account):
+        self.client.force_login(account)
+        response = self.client.get(reverse('admin:account_account_changelist'))
+        self.assertEqual(response.status_code, 200)
+        return response.context['cl']
+
+    def test_superuser_sees_staff_column_and_filter(self):
+        admin = Account.objects.create_superuser(
+            'admin@example.com', self.password, first_name='Admin',
+            phone_number='08000000001'
+        )
+
+        changelist = self.get_changelist(admin)
+
+        self.assertIn('is_staff', changelist.list_display)
+        self.assertIn('is_staff', changelist.list_filter)
+
+    def test_staff_does_not_see_staff_column_or_filter(self):
+        staff = Account.objects.create_user(
+            'staff@example.com', self.password, first_name='Staff',
+            phone_number='08000000002', is_staff=True
+        )
+        staff.user_permissions.add(
+            Permission.objects.get(codename='view_account')
+        )
+
+        changelist = self.get_changelist(staff)
+
+        self.assertNotIn('is_staff', changelist.list_display)
+        self.assertNotIn('is_staff', changelist.list_filter)
@@ -1,11 +1,33 @@
-from account.serializers import AccountProfileReadSerializer
+from account.serializers import (
+    PROFILE_READ_FIELDS, account_profile_representation
+)
 from rest_framework.decorators import api_view
+from rest_framework.pagination import PageNumberPagination
 from account.models import Account
-from rest_framework.response import Response
+
+
+class AccountPagination(PageNumberPagination):
+    """
+    Page-number pagination for account listings.
+
+    Only a single page of accounts is fetched and serialized per
+    request, so memory and response size stay bounded by `page_size`
+    rather than growing with the total number of users.
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
 
 @api_view(['GET'])
 def get_users(request):
     if request.method == "GET":
-        users = Account.objects.all()
-        serializer = AccountProfileReadSerializer(users, many=True)
-        return Response(serializer.data)
\ No newline at end of file
+        # Fetch plain rows with only the columns the profile needs;
+        # the age is computed by the database alongside them.
+        users = Account.objects.with_age().values(
+            *PROFILE_READ_FIELDS
+        ).order_by('-date_updated', 'id')
+        paginator = AccountPagination()
+        page = paginator.paginate_queryset(users, request)
+        data = [account_profile_representation(row, request) for row in page]
+        return paginator.get_paginated_response(data)
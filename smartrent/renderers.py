@@ -0,0 +1,56 @@
+"""
+==========================
+smartrent/renderers.py
+==========================
+
+This module provides an orjson-backed JSON renderer for the API.
+
+`ORJSONRenderer` is a drop-in replacement for DRF's `JSONRenderer` that
+encodes responses in C. Types orjson does not handle natively (e.g.
+Decimal, lazy translation strings, querysets) are delegated to DRF's own
+`JSONEncoder`, and data orjson rejects outright (e.g. integers beyond
+64 bits) is rendered by `JSONRenderer` instead.
+
+Known differences from `JSONRenderer`:
+  - NaN and Infinity are rendered as `null`; `JSONRenderer` raises
+    "Out of range float values are not JSON compliant".
+"""
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+_fallback_encoder = JSONEncoder()
+
+
+def _default(obj):
+    return _fallback_encoder.default(obj)
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    Render API responses to JSON using orjson.
+
+    Datetimes in UTC are written with a trailing "Z", as DRF does.
+    """
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON, returning a bytestring.
+        """
+        if data is None:
+            return b''
+
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        try:
+            ret = orjson.dumps(data, default=_default, option=options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Escape U+2028/U+2029 like JSONRenderer, so output is also valid
+        # JavaScript.
+        return ret.replace(
+            b'\xe2\x80\xa8', b'\\u2028'
+        ).replace(b'\xe2\x80\xa9', b'\\u2029')